@@ -2,9 +2,34 @@
 
 """
 File Structure Tool Package
+
+Public names are resolved lazily (PEP 562), so importing the package, or
+one of its submodules, doesn't pull in every subpackage up front.
 """
 
-from .models import File, Directory, FileStructure
-from .services import JsonCRUD
-from .tools import FileStructureTool
-from .utils import get_logger
+import importlib
+
+# Public name -> subpackage that provides it
+_LAZY = {
+    "File": "models",
+    "Directory": "models",
+    "FileStructure": "models",
+    "JsonCRUD": "services",
+    "FileStructureTool": "tools",
+    "get_logger": "utils",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module("." + _LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -21,23 +21,23 @@ def setup_initial_structure(tool: FileStructureTool):
     """
     # Create 'f:/langchain_project/' directory
     langchain_project = Directory(name="f:/langchain_project")
-    langchain_project.add_file(File(name="env.py"))
-    langchain_project.add_file(File(name="toolkit.py"))
-    langchain_project.add_file(File(name="workflow.py"))
-    langchain_project.add_file(File(name="__init__.py"))
+    langchain_project.add_file(File.get("env.py"))
+    langchain_project.add_file(File.get("toolkit.py"))
+    langchain_project.add_file(File.get("workflow.py"))
+    langchain_project.add_file(File.get("__init__.py"))
 
     # Create 'langchain/' subdirectory within 'f:/langchain_project/'
     langchain_subdir = Directory(name="langchain")
-    langchain_subdir.add_file(File(name="load_env.py"))
+    langchain_subdir.add_file(File.get("load_env.py"))
     langchain_project.add_directory(langchain_subdir)
 
     # Create 'tests/' subdirectory within 'f:/langchain_project/'
     tests_subdir = Directory(name="tests")
-    tests_subdir.add_file(File(name="test_agents.py"))
-    tests_subdir.add_file(File(name="test_managers.py"))
-    tests_subdir.add_file(File(name="test_team.py"))
-    tests_subdir.add_file(File(name="test_toolkit.py"))
-    tests_subdir.add_file(File(name="test_tools.py"))
+    tests_subdir.add_file(File.get("test_agents.py"))
+    tests_subdir.add_file(File.get("test_managers.py"))
+    tests_subdir.add_file(File.get("test_team.py"))
+    tests_subdir.add_file(File.get("test_toolkit.py"))
+    tests_subdir.add_file(File.get("test_tools.py"))
     langchain_project.add_directory(tests_subdir)
 
     # Add 'f:/langchain_project/' to the file structure
@@ -48,16 +48,16 @@ def setup_initial_structure(tool: FileStructureTool):
 
     # Create 'langchain_/' subdirectory
     langchain_ = Directory(name="langchain_")
-    langchain_.add_file(File(name="toolkit.py"))
-    langchain_.add_file(File(name="workflow.py"))
-    langchain_.add_file(File(name="__init__.py"))
+    langchain_.add_file(File.get("toolkit.py"))
+    langchain_.add_file(File.get("workflow.py"))
+    langchain_.add_file(File.get("__init__.py"))
     langchain_root.add_directory(langchain_)
 
     # Create 'langchain/' subdirectory
     langchain = Directory(name="langchain")
-    langchain.add_file(File(name="toolkit.py"))
-    langchain.add_file(File(name="workflow.py"))
-    langchain.add_file(File(name="__init__.py"))
+    langchain.add_file(File.get("toolkit.py"))
+    langchain.add_file(File.get("workflow.py"))
+    langchain.add_file(File.get("__init__.py"))
     langchain_root.add_directory(langchain)
 
     # Add 'f:/langchain/' to the file structure
@@ -96,7 +96,7 @@ def main():
 
     # Example: Add a new file
     try:
-        new_file = File(name="new_file.py")
+        new_file = File.get("new_file.py")
         tool.add_file(path="f:/langchain_project/langchain/new_directory", file=new_file)
     except ValueError as ve:
         logger.error(ve)
@@ -106,9 +106,9 @@ def main():
     tool.display_structure()
 
     # Example: Find a directory
-    found_dir = tool.file_structure.find_directory("f:/langchain_project")
-    if found_dir:
-        logger.info(f"Found directory: {found_dir}")
+    if "f:/langchain_project" in tool.file_structure:
+        found_dir = tool.file_structure["f:/langchain_project"]
+        logger.info("Found directory: %s", found_dir.name)
 
     # Example: Remove a directory
     try:
@@ -2,9 +2,33 @@
 
 """
 Models Package
+
+Model classes are imported on first access (PEP 562), so importing one
+model module doesn't load the others.
 """
 
-from .file import File
-from .directory import Directory
-from .file_structure import FileStructure
-from .base import Serializable
+import importlib
+
+# Public name -> module that defines it
+_LAZY = {
+    "File": "file",
+    "Directory": "directory",
+    "FileStructure": "file_structure",
+    "LazyFileStructure": "lazy_file_structure",
+    "Serializable": "base",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module("." + _LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,8 +6,13 @@ Base Module
 An optional base class or utility for serialization. This is here for
 extensibility if you want a unified approach for all model classes.
 """
+import sys
 from abc import ABC, abstractmethod
 
+# Keyword arguments for @dataclass that give model classes __slots__ where the
+# running Python supports it (3.10+); older interpreters keep a plain dataclass.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 class Serializable(ABC):
     """
     Serializable
@@ -15,6 +20,9 @@ class Serializable(ABC):
     Abstract base class indicating that a model supports
     serialization to/from dictionaries.
     """
+    # Empty slots so subclasses declaring __slots__ don't regain a __dict__
+    __slots__ = ()
+
     @abstractmethod
     def to_dict(self):
         pass
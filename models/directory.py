@@ -13,16 +13,17 @@ Naming Conventions:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
+import sys
 
 from file_structure_tool.models.file import File
 from file_structure_tool.utils.logger import get_logger
-from .base import Serializable
+from .base import DATACLASS_SLOTS, Serializable
 
 logger = get_logger(__name__)
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Directory(Serializable):
     """
     Directory
@@ -32,17 +33,44 @@ class Directory(Serializable):
     name: str
     files: Dict[str, File] = field(default_factory=dict)
     directories: Dict[str, "Directory"] = field(default_factory=dict)
+    # Back-reference to the containing directory, set when attached via add_directory
+    parent: Optional["Directory"] = field(default=None, init=False, repr=False, compare=False)
+    # Memoized to_dict() result, valid while _dirty is False
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Subdirectories passed to the constructor need the back-reference too, or
+        # their changes would never invalidate this directory's memoized to_dict()
+        for sub_dir in self.directories.values():
+            sub_dir.parent = self
+
+    def _mark_dirty(self) -> None:
+        """
+        Invalidate the memoized dictionary of this directory and of every ancestor.
+        Stops early at an already-dirty node, since its ancestors are dirty too.
+        """
+        node = self
+        while node is not None and not node._dirty:
+            node._dirty = True
+            node = node.parent
 
     def add_directory(self, directory: "Directory") -> None:
         """
         Add a subdirectory, ensuring no duplication. Raises ValueError if
         a directory of the same name already exists.
         """
-        if directory.name in self.directories:
-            logger.error(f"Subdirectory '{directory.name}' already exists.")
+        # Intern so the dict key and the name field share one string object
+        directory.name = sys.intern(directory.name)
+        # setdefault inserts only if the name is free; an unchanged size means it wasn't
+        count = len(self.directories)
+        self.directories.setdefault(directory.name, directory)
+        if len(self.directories) == count:
+            logger.error("Subdirectory '%s' already exists.", directory.name)
             raise ValueError(f"Subdirectory '{directory.name}' already exists.")
-        self.directories[directory.name] = directory
-        logger.info(f"Added subdirectory '{directory.name}' to directory '{self.name}'.")
+        directory.parent = self
+        self._mark_dirty()
+        logger.info("Added subdirectory '%s' to directory '%s'.", directory.name, self.name)
 
     def remove_directory(self, directory_name: str) -> None:
         """
@@ -50,10 +78,11 @@ class Directory(Serializable):
         does not exist.
         """
         if directory_name not in self.directories:
-            logger.error(f"Subdirectory '{directory_name}' not found in '{self.name}'.")
+            logger.error("Subdirectory '%s' not found in '%s'.", directory_name, self.name)
             raise KeyError(f"Subdirectory '{directory_name}' not found in '{self.name}'.")
-        del self.directories[directory_name]
-        logger.info(f"Removed subdirectory '{directory_name}' from directory '{self.name}'.")
+        self.directories.pop(directory_name).parent = None
+        self._mark_dirty()
+        logger.info("Removed subdirectory '%s' from directory '%s'.", directory_name, self.name)
 
     def find_directory(self, directory_name: str) -> Optional["Directory"]:
         """
@@ -66,21 +95,25 @@ class Directory(Serializable):
         Add a file to the directory. Raises ValueError if a file with the same name
         already exists.
         """
-        if file.name in self.files:
-            logger.error(f"File '{file.name}' already exists in directory '{self.name}'.")
+        # Single hash probe; File instances are shared, so compare sizes, not identity
+        count = len(self.files)
+        self.files.setdefault(file.name, file)
+        if len(self.files) == count:
+            logger.error("File '%s' already exists in directory '%s'.", file.name, self.name)
             raise ValueError(f"File '{file.name}' already exists in directory '{self.name}'.")
-        self.files[file.name] = file
-        logger.info(f"Added file '{file.name}' to directory '{self.name}'.")
+        self._mark_dirty()
+        logger.info("Added file '%s' to directory '%s'.", file.name, self.name)
 
     def remove_file(self, filename: str) -> None:
         """
         Remove a file by name. Raises KeyError if the file does not exist.
         """
         if filename not in self.files:
-            logger.error(f"File '{filename}' not found in directory '{self.name}'.")
+            logger.error("File '%s' not found in directory '%s'.", filename, self.name)
             raise KeyError(f"File '{filename}' not found in '{self.name}'.")
         del self.files[filename]
-        logger.info(f"Removed file '{filename}' from directory '{self.name}'.")
+        self._mark_dirty()
+        logger.info("Removed file '%s' from directory '%s'.", filename, self.name)
 
     def find_file(self, filename: str) -> Optional[File]:
         """
@@ -91,31 +124,52 @@ class Directory(Serializable):
     def to_dict(self) -> Dict[str, Any]:
         """
         Serialize this directory into a dictionary, including files and subdirectories.
+        The result is memoized until the subtree changes, so treat it as read-only.
         """
-        return {
-            "files": [file_obj.to_dict() for file_obj in self.files.values()],
+        if not self._dirty:
+            return self._cached_dict
+        self._cached_dict = {
+            "files": [{"name": filename} for filename in self.files],
             "directories": {
                 dir_name: dir_obj.to_dict() for dir_name, dir_obj in self.directories.items()
             }
         }
+        self._dirty = False
+        return self._cached_dict
+
+    def pack(self) -> List[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """
+        Flatten this directory tree into a pre-order list of (path, file names) pairs,
+        where path is the tuple of directory names from this directory downward.
+        Walks with an explicit stack, so deep trees don't recurse.
+        """
+        packed = []
+        stack = [((), self)]
+        while stack:
+            prefix, current_dir = stack.pop()
+            dir_path = prefix + (current_dir.name,)
+            packed.append((dir_path, tuple(current_dir.files)))
+            # Reversed so subdirectories come out in insertion order
+            sub_dirs = reversed(list(current_dir.directories.values()))
+            stack.extend((dir_path, sub_dir) for sub_dir in sub_dirs)
+        return packed
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Directory":
+    def from_dict(cls, data: Dict[str, Any], name: str = "") -> "Directory":
         """
-        Create a Directory from a dictionary representation. 'name' must be set manually
-        by the caller after initialization, if needed, since JSON doesn't store it.
+        Create a Directory from a dictionary representation. The JSON form doesn't
+        store a directory's own name (it is the key in the parent), so the caller
+        passes it in as 'name'.
         """
-        # Typically, you'd require the 'name' from outside or store it in 'data'
-        new_dir = cls(name="")  # name can be assigned later
-        files_data = data.get("files", [])
-        for file_info in files_data:
-            file_obj = File.from_dict(file_info)
-            new_dir.add_file(file_obj)
+        new_dir = cls(name=sys.intern(name))
+        # Serialized data is unique by construction, so skip add_file's checks
+        file_objs = [File.get(file_info["name"]) for file_info in data.get("files", [])]
+        new_dir.files = {file_obj.name: file_obj for file_obj in file_objs}
 
         directories_data = data.get("directories", {})
         for sub_dir_name, sub_dir_info in directories_data.items():
-            sub_dir = cls.from_dict(sub_dir_info)
-            sub_dir.name = sub_dir_name
-            new_dir.directories[sub_dir_name] = sub_dir
+            sub_dir = cls.from_dict(sub_dir_info, name=sub_dir_name)
+            sub_dir.parent = new_dir
+            new_dir.directories[sub_dir.name] = sub_dir
 
         return new_dir
@@ -4,16 +4,22 @@ File Model
 ----------
 Represents an individual file within a directory.
 
+Files are immutable, so equal names can share one instance: File.get(name)
+returns a cached File per name, which keeps repeated names (__init__.py, etc.)
+from allocating a new object for every occurrence.
+
 Naming Conventions:
 - Class: File (CamelCase).
 - Methods: from_dict / to_dict for consistent (de)serialization.
 """
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any
-from .base import Serializable
+from .base import DATACLASS_SLOTS, Serializable
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class File(Serializable):
     """
     File
@@ -22,9 +28,21 @@ class File(Serializable):
     """
     name: str
 
+    def __post_init__(self) -> None:
+        # Intern so the name matches the key string in Directory.files
+        object.__setattr__(self, "name", sys.intern(self.name))
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get(cls, name: str) -> "File":
+        """
+        Return the shared File instance for the given name.
+        """
+        return cls(name=name)
+
     def to_dict(self) -> Dict[str, Any]:
         return {"name": self.name}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "File":
-        return cls(name=data["name"])
+        return cls.get(data["name"])
@@ -35,12 +35,42 @@ Example:
 
 from __future__ import annotations
 import json
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Any
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Any, Tuple
+from file_structure_tool.models.base import DATACLASS_SLOTS
 from file_structure_tool.models.directory import Directory
+from file_structure_tool.utils.json_codec import WRITE_BUFFER_SIZE, dumps_json, loads_json
 from file_structure_tool.utils.logger import get_logger
 
-@dataclass
+
+def _components(path: str) -> Tuple[str, ...]:
+    """
+    Splits a path into its components, accepting "/" or "\\" separators and
+    ignoring leading, trailing and repeated separators.
+    """
+    return tuple(part for part in path.replace("\\", "/").split("/") if part)
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """
+    Cached _components, for lookup paths that tend to repeat.
+    """
+    return _components(path)
+
+
+@lru_cache(maxsize=4096)
+def _path_key(path: str) -> str:
+    """
+    Returns the normalized "a/b/c" form of a path used as a path index key,
+    interned so it is the same object as the key stored in the index.
+    """
+    return sys.intern("/".join(_split_path(path)))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FileStructure:
     """
     FileStructure
@@ -49,20 +79,42 @@ class FileStructure:
     in a dictionary keyed by their names.
     """
     directories: Dict[str, Directory] = field(default_factory=dict)
+    # Flat "a/b/c" -> Directory lookup table mirroring the nested tree. It is a cache:
+    # entries are checked against the live tree on every hit and backfilled on a miss,
+    # so mutating Directory objects directly never leaves it wrong
+    _path_index: Dict[str, Directory] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Split top-level name -> its key in directories, so a lookup finds the owning
+    # top-level directory by probing the path's prefixes instead of scanning names
+    _roots: Dict[Tuple[str, ...], str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # len(directories) when _roots was last in step with it
+    _roots_size: int = field(default=0, init=False, repr=False, compare=False)
 
     # Use the logger for consistent logs across methods
     logger = get_logger(__name__)
 
+    def __post_init__(self) -> None:
+        self.reindex()
+
     def add_directory(self, directory: Directory) -> None:
         """
         Adds a top-level directory to the file structure. Raises ValueError if
         a directory with the same name already exists.
         """
-        if directory.name in self.directories:
-            self.logger.error(f"Top-level directory '{directory.name}' already exists.")
+        # setdefault inserts only if the name is free; an unchanged size means it wasn't
+        count = len(self.directories)
+        self.directories.setdefault(directory.name, directory)
+        if len(self.directories) == count:
+            self.logger.error("Top-level directory '%s' already exists.", directory.name)
             raise ValueError(f"Top-level directory '{directory.name}' already exists.")
-        self.directories[directory.name] = directory
-        self.logger.info(f"Added top-level directory '{directory.name}'.")
+        self._sync_roots()
+        self._roots.setdefault(_components(directory.name), directory.name)
+        self._roots_size = len(self.directories)
+        self.index_directory(directory.name, directory)
+        self.logger.info("Added top-level directory '%s'.", directory.name)
 
     def remove_directory(self, directory_name: str) -> None:
         """
@@ -70,21 +122,22 @@ class FileStructure:
         does not exist.
         """
         if directory_name not in self.directories:
-            self.logger.error(f"Top-level directory '{directory_name}' not found.")
+            self.logger.error("Top-level directory '%s' not found.", directory_name)
             raise KeyError(f"Top-level directory '{directory_name}' not found.")
         del self.directories[directory_name]
-        self.logger.info(f"Removed top-level directory '{directory_name}'.")
+        self._sync_roots()
+        components = _components(directory_name)
+        if self._roots.get(components) == directory_name:
+            del self._roots[components]
+        self._roots_size = len(self.directories)
+        self.unindex_path(directory_name)
+        self.logger.info("Removed top-level directory '%s'.", directory_name)
 
     def find_directory(self, directory_name: str) -> Optional[Directory]:
         """
         Retrieves a top-level directory by name. Returns None if not found.
         """
-        directory = self.directories.get(directory_name)
-        if directory:
-            self.logger.info(f"Top-level directory '{directory_name}' found.")
-        else:
-            self.logger.warning(f"Top-level directory '{directory_name}' not found.")
-        return directory
+        return self.directories.get(directory_name)
 
     def list_directories(self) -> Dict[str, Directory]:
         """
@@ -97,27 +150,164 @@ class FileStructure:
         """
         Retrieves a directory by its full path (e.g., "f:/langchain_project/langchain").
         Returns None if the path cannot be resolved.
+
+        The path index answers most lookups; a hit is confirmed by following the
+        directory's parent chain, and a miss (or a stale hit) falls back to walking
+        the tree, so directories added or removed through Directory itself are seen.
         """
-        parts = path.strip("/").split("/")
-        if not parts or not parts[0]:
-            self.logger.warning("Empty or invalid path provided.")
-            return None
+        key = _path_key(path)
+        directory = self._path_index.get(key)
+        if directory is not None and self._is_attached_at(directory, key):
+            return directory
+        parts = _split_path(key)
+        matched, directory = self._descend(parts)
+        if matched != len(parts):
+            directory = None
+        if directory is None:
+            self._path_index.pop(key, None)
+        else:
+            self._path_index[key] = directory
+        return directory
 
-        # Start at top-level
-        current_dir = self.directories.get(parts[0])
-        if not current_dir:
-            self.logger.warning(f"Root directory '{parts[0]}' not found.")
-            return None
+    def _is_attached_at(self, directory: Directory, key: str) -> bool:
+        """
+        True if the directory is still reachable from a top-level directory at the
+        given index key.
+        """
+        parts = _split_path(key)
+        end = len(parts)
+        node = directory
+        while node.parent is not None:
+            end -= 1
+            if end <= 0 or parts[end] != node.name:
+                return False
+            node = node.parent
+        self._sync_roots()
+        dir_name = self._roots.get(parts[:end])
+        return dir_name is not None and self.directories.get(dir_name) is node
 
-        # Traverse deeper
-        for sub_name in parts[1:]:
-            current_dir = current_dir.find_directory(sub_name)
-            if not current_dir:
-                self.logger.warning(f"Subdirectory '{sub_name}' not found in path '{path}'.")
-                return None
+    def _descend(self, parts: Tuple[str, ...]) -> Tuple[int, Optional[Directory]]:
+        """
+        Walks the live tree along the given path components and returns how many of
+        them resolved and the deepest directory reached, or (0, None). The owning
+        top-level directory is found by probing the path's prefixes in _roots, so
+        the cost depends on the path's depth, not on the number of top-level
+        directories; a lazily loaded mapping only parses the owners it probes.
+        """
+        self._sync_roots()
+        best_matched, best_dir = 0, None
+        for end in range(len(parts), 0, -1):
+            dir_name = self._roots.get(parts[:end])
+            if dir_name is None:
+                continue
+            current_dir = self.directories.get(dir_name)
+            if current_dir is None:
+                continue
+            matched = end
+            for part in parts[end:]:
+                sub_dir = current_dir.directories.get(part)
+                if sub_dir is None:
+                    break
+                current_dir = sub_dir
+                matched += 1
+            if matched == len(parts):
+                return matched, current_dir
+            if matched > best_matched:
+                best_matched, best_dir = matched, current_dir
+        return best_matched, best_dir
+
+    def _sync_roots(self) -> None:
+        """
+        Rebuilds _roots if top-level directories were added or removed by editing
+        the directories mapping directly.
+        """
+        if self._roots_size != len(self.directories):
+            self._rebuild_roots()
 
-        self.logger.info(f"Path '{path}' resolved to directory '{current_dir.name}'.")
-        return current_dir
+    def _rebuild_roots(self) -> None:
+        self._roots.clear()
+        for dir_name in self.directories:
+            self._roots.setdefault(_components(dir_name), dir_name)
+        self._roots_size = len(self.directories)
+
+    def longest_prefix(self, path: str) -> Tuple[str, Optional[Directory]]:
+        """
+        Returns the key and directory of the deepest existing directory along the
+        given path, or ("", None) if not even its first component exists. Takes a
+        single descent from the owning top-level directory.
+        """
+        parts = _split_path(path)
+        matched, directory = self._descend(parts)
+        if directory is None:
+            return "", None
+        return _path_key("/".join(parts[:matched])), directory
+
+    def __getitem__(self, path: str) -> Directory:
+        """
+        Returns the directory at the given full path. Raises KeyError if not found.
+        """
+        directory = self.get_directory_by_path(path)
+        if directory is None:
+            raise KeyError(path)
+        return directory
+
+    def __contains__(self, path: str) -> bool:
+        """
+        Returns True if a directory exists at the given full path.
+        """
+        return self.get_directory_by_path(path) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the full paths of every directory in the structure.
+        """
+        self.reindex()
+        return iter(list(self._path_index))
+
+    def index_directory(self, path: str, directory: Directory) -> None:
+        """
+        Registers a directory and its whole subtree in the path index under the given
+        full path. Call this after attaching a directory below a top-level directory.
+        """
+        stack = [(_path_key(path), directory)]
+        while stack:
+            dir_path, current_dir = stack.pop()
+            self._path_index[dir_path] = current_dir
+            for sub_name, sub_dir in current_dir.directories.items():
+                # Repair back-references for subtrees assembled by hand; the parent may
+                # hold a to_dict() memo that missed the child's changes, so drop it
+                if sub_dir.parent is not current_dir:
+                    sub_dir.parent = current_dir
+                    current_dir._mark_dirty()
+                stack.append((sys.intern(f"{dir_path}/{sub_name}"), sub_dir))
+
+    def unindex_path(self, path: str) -> None:
+        """
+        Drops a directory path and every path below it from the path index. Call this
+        after detaching a directory below a top-level directory.
+        """
+        # Walk the detached subtree itself, so the cost is the subtree's size rather
+        # than a scan over every indexed path
+        directory = self._path_index.pop(_path_key(path), None)
+        if directory is None:
+            return
+        stack = [(_path_key(path), directory)]
+        while stack:
+            dir_path, current_dir = stack.pop()
+            for sub_name, sub_dir in current_dir.directories.items():
+                sub_path = f"{dir_path}/{sub_name}"
+                self._path_index.pop(sub_path, None)
+                stack.append((sub_path, sub_dir))
+
+    def reindex(self) -> None:
+        """
+        Rebuilds the path index from scratch, dropping any entries that no longer
+        match the tree.
+        """
+        self._path_index.clear()
+        self._rebuild_roots()
+        for dir_name, directory in self.directories.items():
+            self.index_directory(dir_name, directory)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -133,11 +323,11 @@ class FileStructure:
         Serializes the file structure to JSON and writes it to the given filepath.
         """
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.to_dict(), f, indent=4)
-            self.logger.info(f"Serialized file structure to '{filepath}'.")
+            with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(dumps_json(self.to_dict()))
+            self.logger.info("Serialized file structure to '%s'.", filepath)
         except Exception as e:
-            self.logger.exception(f"Failed to serialize file structure to '{filepath}': {e}")
+            self.logger.exception("Failed to serialize file structure to '%s': %s", filepath, e)
             raise
 
     @classmethod
@@ -147,9 +337,10 @@ class FileStructure:
         """
         fs = cls()
         for dir_name, dir_data in data.items():
-            directory_obj = Directory.from_dict(dir_data)
+            directory_obj = Directory.from_dict(dir_data, name=dir_name)
             fs.directories[dir_name] = directory_obj
-            cls.logger.debug(f"Deserialized directory '{dir_name}' from data.")
+            cls.logger.debug("Deserialized directory '%s' from data.", dir_name)
+        fs.reindex()
         cls.logger.info("Created FileStructure from dictionary.")
         return fs
 
@@ -159,27 +350,30 @@ class FileStructure:
         Deserializes a FileStructure from JSON stored at filepath.
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = loads_json(f.read())
             fs = cls.from_dict(data)
-            cls.logger.info(f"Deserialized file structure from '{filepath}'.")
+            cls.logger.info("Deserialized file structure from '%s'.", filepath)
             return fs
         except FileNotFoundError:
-            cls.logger.error(f"JSON file '{filepath}' not found.")
+            cls.logger.error("JSON file '%s' not found.", filepath)
             raise
         except json.JSONDecodeError as e:
-            cls.logger.exception(f"Invalid JSON format in '{filepath}': {e}")
+            cls.logger.exception("Invalid JSON format in '%s': %s", filepath, e)
             raise
         except Exception as e:
-            cls.logger.exception(f"Failed to deserialize from '{filepath}': {e}")
+            cls.logger.exception("Failed to deserialize from '%s': %s", filepath, e)
             raise
 
+    def to_pretty_json(self) -> str:
+        """
+        Returns the whole file structure as an indented JSON string, for display.
+        """
+        return dumps_json(self.to_dict()).decode("utf-8")
+
     def __repr__(self) -> str:
         """
-        Returns a string representation of the FileStructure, in JSON format if possible.
+        Returns a short summary of the FileStructure. Use to_pretty_json() for the
+        full contents.
         """
-        try:
-            return json.dumps(self.to_dict(), indent=4)
-        except Exception as e:
-            self.logger.exception(f"Failed to generate JSON repr for FileStructure: {e}")
-            return super().__repr__()
+        return f"<FileStructure top_level={len(self.directories)}>"
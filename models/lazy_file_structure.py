@@ -0,0 +1,169 @@
+# file_structure_tool/models/lazy_file_structure.py
+
+"""
+LazyFileStructure Model
+-----------------------
+A FileStructure that only builds the Directory objects a caller actually touches.
+
+Opening the file reads it into memory and decodes it in one C-level pass
+(orjson when installed), which is far cheaper than building a Directory and
+File object for every node. Each top-level directory stays as its decoded
+dictionary until it is first looked up; only then is it turned into Directory
+objects and added to the path index.
+
+Serializing (to_dict, saving) writes untouched top-level directories back
+from their decoded dictionaries without building them. Iteration needs every
+path, so it builds whatever is left. A LazyFileStructure can be used anywhere
+a FileStructure is expected.
+
+Example:
+--------
+    fs = LazyFileStructure.open("json_files/file_structure.json")
+    fs.get_directory_by_path("f:/langchain_project/tests")  # builds one subtree
+"""
+
+from __future__ import annotations
+import json
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from file_structure_tool.models.directory import Directory
+from file_structure_tool.models.file_structure import FileStructure
+from file_structure_tool.utils.json_codec import loads_json
+
+
+class LazyDirectoryMap(MutableMapping):
+    """
+    Mapping of top-level directory names to Directory objects that are built from
+    their decoded JSON dictionaries on first access.
+    """
+    __slots__ = ("_entries", "_on_load")
+
+    def __init__(self, data: Dict[str, Any]):
+        # name -> Directory once built, or its decoded dictionary until then
+        self._entries: Dict[str, Union[Directory, Dict[str, Any]]] = dict(data)
+        self._on_load: Optional[Callable[[str, Directory], None]] = None
+
+    def load(self, name: str) -> Directory:
+        """
+        Return the named directory, building it from its dictionary if necessary.
+        """
+        entry = self._entries[name]
+        if isinstance(entry, Directory):
+            return entry
+        directory = Directory.from_dict(entry, name=name)
+        self._entries[name] = directory
+        if self._on_load is not None:
+            self._on_load(name, directory)
+        return directory
+
+    def loaded_items(self) -> Iterator[Tuple[str, Directory]]:
+        """
+        Yield (name, Directory) pairs for the entries built so far.
+        """
+        for name, entry in self._entries.items():
+            if isinstance(entry, Directory):
+                yield name, entry
+
+    def serialized_items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield (name, dictionary) pairs for every entry without building any: built
+        entries are serialized, untouched ones are returned as decoded.
+        """
+        for name, entry in self._entries.items():
+            yield name, entry.to_dict() if isinstance(entry, Directory) else entry
+
+    def load_all(self) -> None:
+        """
+        Build every entry that has not been built yet.
+        """
+        for name in [name for name, entry in self._entries.items()
+                     if not isinstance(entry, Directory)]:
+            self.load(name)
+
+    def __getitem__(self, name: str) -> Directory:
+        return self.load(name)
+
+    def __setitem__(self, name: str, directory: Directory) -> None:
+        self._entries[name] = directory
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LazyFileStructure(FileStructure):
+    """
+    LazyFileStructure
+    -----------------
+    FileStructure whose top-level directories are built from the decoded JSON
+    file on demand. Build one with LazyFileStructure.open(filepath).
+    """
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        if isinstance(self.directories, LazyDirectoryMap):
+            self.directories._on_load = self.index_directory
+        super().__post_init__()
+
+    @classmethod
+    def open(cls, filepath: str) -> LazyFileStructure:
+        """
+        Read and decode the JSON file at filepath without building its top-level
+        directories. The file is read fully up front, so it may be rewritten
+        afterwards without affecting this structure.
+        """
+        try:
+            with open(filepath, "rb") as f:
+                data = loads_json(f.read())
+            if not isinstance(data, dict):
+                raise json.JSONDecodeError("Expected a top-level JSON object", "", 0)
+            fs = cls(directories=LazyDirectoryMap(data))
+            cls.logger.info("Opened file structure '%s' for lazy loading.", filepath)
+            return fs
+        except FileNotFoundError:
+            cls.logger.error("JSON file '%s' not found.", filepath)
+            raise
+        except json.JSONDecodeError as e:
+            cls.logger.exception("Invalid JSON format in '%s': %s", filepath, e)
+            raise
+        except Exception as e:
+            cls.logger.exception("Failed to open '%s': %s", filepath, e)
+            raise
+
+    def _load_all(self) -> None:
+        if isinstance(self.directories, LazyDirectoryMap):
+            self.directories.load_all()
+
+    def reindex(self) -> None:
+        """
+        Rebuilds the path index from the top-level directories built so far.
+        """
+        if not isinstance(self.directories, LazyDirectoryMap):
+            super().reindex()
+            return
+        self._path_index.clear()
+        self._rebuild_roots()
+        for dir_name, directory in self.directories.loaded_items():
+            self.index_directory(dir_name, directory)
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_all()
+        return super().__iter__()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializes the entire file structure. Directories that were never looked up
+        are returned as decoded from the file, without being built.
+        """
+        if not isinstance(self.directories, LazyDirectoryMap):
+            return super().to_dict()
+        return dict(self.directories.serialized_items())
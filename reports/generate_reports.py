@@ -28,47 +28,66 @@ NOTE:
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import List, Tuple, Optional
 
 from file_structure_tool.tools.file_structure_tool import FileStructureTool
 from file_structure_tool.models.directory import Directory
 from file_structure_tool.models.file import File
+from file_structure_tool.utils.json_codec import WRITE_BUFFER_SIZE
 from file_structure_tool.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-def _collect_files_and_contents(path_prefix: str, directory: Directory) -> List[Tuple[str, str]]:
+def _read_one(full_path: str) -> str:
     """
-    Recursively collect all files from the given directory along with their contents.
+    Read a single file from disk, returning a placeholder string on failure.
+
+    :param full_path: Path of the file to read.
+    :return: The file contents, or a marker describing why it could not be read.
+    """
+    try:
+        return Path(full_path).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        logger.warning("File not found on disk: %s", full_path)
+        return "<FILE NOT FOUND ON DISK>"
+    except Exception as e:
+        logger.error("Could not read file '%s': %s", full_path, e)
+        return f"<ERROR: {e}>"
+
+def _collect_files_and_contents(
+    path_prefix: str,
+    directory: Directory,
+    out: Optional[List[Tuple[str, str]]] = None
+) -> List[Tuple[str, str]]:
+    """
+    Collect all files from the given directory tree along with their contents.
+    The tree is flattened with Directory.pack() rather than walked recursively,
+    then the files are read concurrently on a thread pool.
 
     :param path_prefix: The accumulated path leading to the current directory.
     :param directory:   The Directory instance to explore.
-    :return: A list of (filepath, file_contents) tuples.
+    :param out:         Optional list to append results to, instead of a new one.
+    :return: The list of (filepath, file_contents) tuples.
     """
-    results = []
-    # Collect file contents
-    for filename, file_obj in directory.files.items():
-        full_path = os.path.join(path_prefix, directory.name, filename)
-        # Attempt to read file from disk if it actually exists
-        try:
-            with open(full_path, "r", encoding="utf-8") as f:
-                contents = f.read()
-            results.append((full_path, contents))
-        except FileNotFoundError:
-            logger.warning(f"File not found on disk: {full_path}")
-            results.append((full_path, "<FILE NOT FOUND ON DISK>"))
-        except Exception as e:
-            logger.error(f"Could not read file '{full_path}': {e}")
-            results.append((full_path, f"<ERROR: {e}>"))
-
-    # Recurse into subdirectories
-    for subdir_name, subdir_obj in directory.directories.items():
-        results.extend(_collect_files_and_contents(
-            os.path.join(path_prefix, directory.name),
-            subdir_obj
-        ))
-
-    return results
+    out = [] if out is None else out
+    # Plain string concatenation instead of os.path.join in the per-file loop
+    sep = os.sep
+    head = path_prefix.rstrip(sep) + sep if path_prefix else ""
+    paths = []
+    for dir_path, filenames in directory.pack():
+        base = head + sep.join(dir_path) + sep
+        paths.extend([base + filename for filename in filenames])
+
+    if not paths:
+        return out
+
+    # Reads are I/O bound, so overlap them; map() preserves the walk order
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        out.extend(zip(paths, executor.map(_read_one, paths)))
+    return out
 
 def generate_full_report(json_directory: Optional[str] = None) -> str:
     """
@@ -131,11 +150,12 @@ def main():
     # Optionally, write to a file
     output_file = "full_report.md"
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(report)
-        logger.info(f"Comprehensive file report written to '{output_file}'.")
+        # Encode once and hand the whole report to a single large-buffer write
+        with open(output_file, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(report.encode("utf-8"))
+        logger.info("Comprehensive file report written to '%s'.", output_file)
     except Exception as e:
-        logger.error(f"Failed to write the report to '{output_file}': {e}")
+        logger.error("Failed to write the report to '%s': %s", output_file, e)
 
 if __name__ == "__main__":
     main()
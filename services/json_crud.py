@@ -7,8 +7,10 @@ A utility class for listing, reading, and writing JSON files within a designated
 """
 
 import os
-import json
-from typing import List
+import secrets
+import stat
+from typing import Any, Dict, List, Tuple
+from file_structure_tool.utils.json_codec import WRITE_BUFFER_SIZE, dumps_json, loads_json
 from file_structure_tool.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,9 +26,11 @@ class JsonCRUD:
         :param directory: Path to the directory containing JSON files.
         """
         self.directory = directory
+        # filename -> ((st_mtime_ns, st_size), parsed data) of the last read
+        self._cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
         if not os.path.exists(self.directory):
             os.makedirs(self.directory, exist_ok=True)
-            logger.info(f"Created directory '{self.directory}' for JSON files.")
+            logger.info("Created directory '%s' for JSON files.", self.directory)
 
     def list_json_files(self) -> List[str]:
         """
@@ -35,30 +39,60 @@ class JsonCRUD:
         try:
             return [f for f in os.listdir(self.directory) if f.endswith(".json")]
         except Exception as e:
-            logger.exception(f"Failed to list JSON files in '{self.directory}': {e}")
+            logger.exception("Failed to list JSON files in '%s': %s", self.directory, e)
             return []
 
     def read_json(self, filename: str) -> dict:
         """
-        Read and parse JSON from a file in this directory.
+        Read and parse JSON from a file in this directory. Parsed data is cached
+        until the file's modification time or size changes, so treat it as read-only.
         """
         filepath = os.path.join(self.directory, filename)
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                return json.load(f)
+            st = os.stat(filepath)
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(filename)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            with open(filepath, "rb") as f:
+                data = loads_json(f.read())
+            self._cache[filename] = (stamp, data)
+            return data
         except Exception as e:
-            logger.exception(f"Failed to read JSON from '{filepath}': {e}")
+            logger.exception("Failed to read JSON from '%s': %s", filepath, e)
             raise
 
     def write_json(self, filename: str, data: dict) -> None:
         """
-        Write a Python dictionary as JSON to a file in this directory.
+        Write a Python dictionary as JSON to a file in this directory. The data goes
+        to a temporary file that then replaces the target, so readers never see a
+        partially written file.
         """
         filepath = os.path.join(self.directory, filename)
+        self._cache.pop(filename, None)
+        tmp_path = None
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-            logger.info(f"Wrote JSON to '{filepath}'.")
+            # A unique temp file per write, so concurrent writers never share one.
+            # O_EXCL never reuses an existing file, and mode 0o666 lets the kernel
+            # apply the umask just as a plain open() would.
+            candidate = f"{filepath}.{secrets.token_hex(8)}.tmp"
+            flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+            fd = os.open(candidate, flags, 0o666)
+            tmp_path = candidate
+            with os.fdopen(fd, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(dumps_json(data))
+            # Keep the permissions of the file being replaced
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(filepath).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, filepath)
+            logger.info("Wrote JSON to '%s'.", filepath)
         except Exception as e:
-            logger.exception(f"Failed to write JSON to '{filepath}': {e}")
+            logger.exception("Failed to write JSON to '%s': %s", filepath, e)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
             raise
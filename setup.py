@@ -15,7 +15,7 @@ setup(
     author_email="Timothy.Greggl@complete.tech",
     license="MIT",
     python_requires=">=3.7",
-    install_requires=[],  # Add any runtime dependencies here
+    install_requires=["orjson>=3.6"],  # Add any runtime dependencies here
 )
 
 # Explanation:
@@ -0,0 +1,83 @@
+# file_structure_tool/tests/test_decorators.py
+
+import tempfile
+import unittest
+from unittest import mock
+
+from file_structure_tool.models.directory import Directory
+from file_structure_tool.models.file import File
+from file_structure_tool.models.file_structure import FileStructure
+from file_structure_tool.tools.file_structure_tool import FileStructureTool
+from file_structure_tool.utils.decorators import require_directory_and_save
+
+
+class _Tool(FileStructureTool):
+
+    @require_directory_and_save
+    def make_dir(self, target_dir, name):
+        target_dir.add_directory(Directory(name=name))
+
+    @require_directory_and_save
+    def drop_dir(self, target_dir, name):
+        target_dir.remove_directory(name)
+
+    @require_directory_and_save
+    def touch(self, target_dir, filename):
+        target_dir.add_file(File.get(filename))
+
+
+class _PlainHost:
+    """Host with only file_structure, logger and save(), no get_directory."""
+
+    def __init__(self, file_structure):
+        self.file_structure = file_structure
+        self.logger = mock.Mock()
+        self.saves = 0
+
+    def save(self):
+        self.saves += 1
+
+    @require_directory_and_save
+    def touch(self, target_dir, filename):
+        target_dir.add_file(File.get(filename))
+
+
+class RequireDirectoryAndSaveTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tool = _Tool(self._tmp.name)
+        self.tool.file_structure.add_directory(Directory(name="f:/proj"))
+
+    def test_directories_created_by_a_decorated_call_are_resolvable(self):
+        self.tool.make_dir("f:/proj", "sub")
+        self.tool.touch("f:/proj/sub", "a.py")
+        self.assertIn("a.py", self.tool.file_structure["f:/proj/sub"].files)
+
+    def test_directories_removed_by_a_decorated_call_are_not_resolvable(self):
+        self.tool.make_dir("f:/proj", "gone")
+        self.tool.touch("f:/proj/gone", "a.py")
+        self.tool.drop_dir("f:/proj", "gone")
+        with self.assertRaises(ValueError):
+            self.tool.touch("f:/proj/gone", "lost.py")
+
+    def test_saves_once_per_batch(self):
+        with mock.patch.object(self.tool.json_crud, "write_json") as write_json:
+            with self.tool.batch():
+                for i in range(3):
+                    self.tool.touch("f:/proj", f"{i}.py")
+            self.assertEqual(write_json.call_count, 1)
+
+    def test_host_without_get_directory_uses_the_file_structure(self):
+        host = _PlainHost(FileStructure())
+        host.file_structure.add_directory(Directory(name="root"))
+        host.touch("root", "a.py")
+        self.assertIn("a.py", host.file_structure["root"].files)
+        self.assertEqual(host.saves, 1)
+        with self.assertRaises(ValueError):
+            host.touch("missing", "a.py")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# file_structure_tool/tests/test_directory.py
+
+import unittest
+
+from file_structure_tool.models.directory import Directory
+from file_structure_tool.models.file import File
+from file_structure_tool.models.file_structure import FileStructure
+
+
+class ToDictMemoTest(unittest.TestCase):
+
+    def test_reflects_changes_below_a_memoized_directory(self):
+        root = Directory(name="root")
+        child = Directory(name="child")
+        root.add_directory(child)
+        self.assertEqual(root.to_dict()["directories"]["child"]["files"], [])
+        child.add_file(File.get("a.py"))
+        self.assertEqual(root.to_dict()["directories"]["child"]["files"], [{"name": "a.py"}])
+        child.remove_file("a.py")
+        self.assertEqual(root.to_dict()["directories"]["child"]["files"], [])
+
+    def test_reflects_removed_subdirectories(self):
+        root = Directory(name="root")
+        root.add_directory(Directory(name="child"))
+        root.to_dict()
+        root.remove_directory("child")
+        self.assertEqual(root.to_dict()["directories"], {})
+
+    def test_constructor_supplied_children(self):
+        child = Directory(name="c")
+        root = Directory(name="r", directories={"c": child})
+        self.assertIs(child.parent, root)
+        root.to_dict()
+        child.add_file(File.get("x.py"))
+        fs = FileStructure()
+        fs.add_directory(root)
+        self.assertEqual(fs.to_dict()["r"]["directories"]["c"]["files"], [{"name": "x.py"}])
+
+    def test_index_repairs_links_and_drops_stale_memos(self):
+        root = Directory(name="r")
+        child = Directory(name="c")
+        root.directories["c"] = child  # attached by hand, no back-reference
+        root.to_dict()
+        child.add_file(File.get("x.py"))
+        fs = FileStructure()
+        fs.add_directory(root)
+        self.assertIs(child.parent, root)
+        self.assertEqual(fs.to_dict()["r"]["directories"]["c"]["files"], [{"name": "x.py"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
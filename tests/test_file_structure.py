@@ -0,0 +1,63 @@
+# file_structure_tool/tests/test_file_structure.py
+
+import unittest
+
+from file_structure_tool.models.directory import Directory
+from file_structure_tool.models.file_structure import FileStructure
+
+
+class PathLookupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.fs = FileStructure()
+        self.root = Directory(name="f:/proj")
+        self.fs.add_directory(self.root)
+
+    def test_finds_directories_added_through_directory(self):
+        self.fs["f:/proj"].add_directory(Directory(name="sub"))
+        self.assertIn("f:/proj/sub", self.fs)
+        self.assertIs(self.fs["f:\\proj\\sub"], self.root.directories["sub"])
+
+    def test_forgets_directories_removed_through_directory(self):
+        self.root.add_directory(Directory(name="gone"))
+        self.assertIn("f:/proj/gone", self.fs)
+        self.root.remove_directory("gone")
+        self.assertNotIn("f:/proj/gone", self.fs)
+        self.assertIsNone(self.fs.get_directory_by_path("f:/proj/gone"))
+
+    def test_follows_a_moved_directory(self):
+        moved = Directory(name="moved")
+        self.root.add_directory(Directory(name="a"))
+        self.root.add_directory(moved)
+        self.assertIs(self.fs["f:/proj/moved"], moved)
+        self.root.remove_directory("moved")
+        self.root.directories["a"].add_directory(moved)
+        self.assertNotIn("f:/proj/moved", self.fs)
+        self.assertIs(self.fs["f:/proj/a/moved"], moved)
+
+    def test_iterates_the_live_tree(self):
+        self.root.add_directory(Directory(name="a"))
+        built = FileStructure(directories={"r": Directory("r", directories={"c": Directory("c")})})
+        self.assertEqual(sorted(self.fs), ["f:/proj", "f:/proj/a"])
+        self.assertEqual(sorted(built), ["r", "r/c"])
+
+    def test_top_level_names_are_normalized(self):
+        self.fs.add_directory(Directory(name="/home/u"))
+        self.fs.directories["f:\\win"] = Directory(name="f:\\win")  # bypasses add_directory
+        self.assertIn("home/u", self.fs)
+        self.assertIn("f:/win", self.fs)
+        self.fs.remove_directory("/home/u")
+        del self.fs.directories["f:\\win"]
+        self.assertNotIn("/home/u", self.fs)
+        self.assertNotIn("f:/win", self.fs)
+        self.assertIn("f:/proj", self.fs)
+
+    def test_longest_prefix(self):
+        self.root.add_directory(Directory(name="a"))
+        self.assertEqual(self.fs.longest_prefix("f:/proj/a/x/y"),
+                         ("f:/proj/a", self.root.directories["a"]))
+        self.assertEqual(self.fs.longest_prefix("g:/x"), ("", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
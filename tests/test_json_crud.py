@@ -0,0 +1,101 @@
+# file_structure_tool/tests/test_json_crud.py
+
+import os
+import stat
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from file_structure_tool.services.json_crud import JsonCRUD
+
+
+class WriteJsonTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.directory = self._tmp.name
+        self.crud = JsonCRUD(self.directory)
+        self.path = os.path.join(self.directory, "data.json")
+
+    def test_leaves_only_the_target_file(self):
+        self.crud.write_json("data.json", {"a": 1})
+        self.assertEqual(os.listdir(self.directory), ["data.json"])
+        self.assertEqual(self.crud.read_json("data.json"), {"a": 1})
+
+    def test_failed_write_keeps_the_old_file(self):
+        self.crud.write_json("data.json", {"a": 1})
+        with self.assertRaises(TypeError):
+            self.crud.write_json("data.json", {"a": object()})
+        self.assertEqual(os.listdir(self.directory), ["data.json"])
+        self.assertEqual(self.crud.read_json("data.json"), {"a": 1})
+
+    def test_cleanup_failure_does_not_hide_the_error(self):
+        with mock.patch("os.remove", side_effect=OSError("busy")):
+            with self.assertRaises(TypeError):
+                self.crud.write_json("data.json", {"a": object()})
+
+    def test_concurrent_writers_never_publish_a_partial_file(self):
+        def write(i):
+            for _ in range(20):
+                self.crud.write_json("data.json", {"writer": i, "pad": "x" * 50000})
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(os.listdir(self.directory), ["data.json"])
+        self.assertIn(self.crud.read_json("data.json")["writer"], range(4))
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_keeps_the_mode_of_the_replaced_file(self):
+        self.crud.write_json("data.json", {"a": 1})
+        os.chmod(self.path, 0o640)
+        self.crud.write_json("data.json", {"a": 2})
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_new_files_follow_the_umask(self):
+        umask = os.umask(0o027)
+        try:
+            self.crud.write_json("data.json", {"a": 1})
+        finally:
+            os.umask(umask)
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o640)
+
+
+class ReadJsonCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.crud = JsonCRUD(self._tmp.name)
+        self.path = os.path.join(self._tmp.name, "data.json")
+
+    def test_unchanged_file_is_parsed_once(self):
+        self.crud.write_json("data.json", {"a": 1})
+        with mock.patch("file_structure_tool.services.json_crud.loads_json",
+                        return_value={"a": 1}) as loads:
+            first = self.crud.read_json("data.json")
+            second = self.crud.read_json("data.json")
+        self.assertIs(first, second)
+        self.assertEqual(loads.call_count, 1)
+
+    def test_write_json_invalidates(self):
+        self.crud.write_json("data.json", {"a": 1})
+        self.assertEqual(self.crud.read_json("data.json"), {"a": 1})
+        self.crud.write_json("data.json", {"a": 2})
+        self.assertEqual(self.crud.read_json("data.json"), {"a": 2})
+
+    def test_external_change_invalidates(self):
+        self.crud.write_json("data.json", {"a": 1})
+        self.assertEqual(self.crud.read_json("data.json"), {"a": 1})
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"a": 22}')
+        self.assertEqual(self.crud.read_json("data.json"), {"a": 22})
+
+
+if __name__ == "__main__":
+    unittest.main()
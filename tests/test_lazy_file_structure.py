@@ -0,0 +1,107 @@
+# file_structure_tool/tests/test_lazy_file_structure.py
+
+import json
+import os
+import tempfile
+import unittest
+
+from file_structure_tool.models.directory import Directory
+from file_structure_tool.models.file import File
+from file_structure_tool.models.file_structure import FileStructure
+from file_structure_tool.models.lazy_file_structure import LazyFileStructure
+from file_structure_tool.tools.file_structure_tool import FileStructureTool
+
+
+def _tree(name, sub_name="sub", files=("a.py",)):
+    directory = Directory(name=name)
+    sub_dir = Directory(name=sub_name)
+    for filename in files:
+        sub_dir.add_file(File.get(filename))
+    directory.add_directory(sub_dir)
+    return directory
+
+
+class LazyFileStructureTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.json_dir = self._tmp.name
+        self.json_path = os.path.join(self.json_dir, "file_structure.json")
+
+    def _save(self, *directories):
+        fs = FileStructure()
+        for directory in directories:
+            fs.add_directory(directory)
+        fs.to_json(self.json_path)
+        return fs
+
+    def _write(self, text):
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_round_trip(self):
+        fs = self._save(_tree("f:/proj"), _tree("other", "pkg", ("x.py", "y.py")))
+        lazy = LazyFileStructure.open(self.json_path)
+        self.assertEqual(lazy.to_dict(), fs.to_dict())
+        self.assertEqual(sorted(lazy), sorted(fs))
+
+    def test_parses_only_the_directories_looked_up(self):
+        self._save(_tree("first"), _tree("second"))
+        lazy = LazyFileStructure.open(self.json_path)
+        self.assertEqual(list(lazy.directories.loaded_items()), [])
+        self.assertEqual(lazy.get_directory_by_path("second/sub").name, "sub")
+        self.assertEqual([name for name, _ in lazy.directories.loaded_items()], ["second"])
+
+    def test_escaped_and_brace_names(self):
+        names = ['we"ird', "{braces}", "close}{open", 'esc\\"aped}']
+        fs = self._save(*(_tree(name, name + "_sub", (name + ".txt",)) for name in names))
+        lazy = LazyFileStructure.open(self.json_path)
+        self.assertEqual(list(lazy.directories), names)
+        self.assertEqual(lazy.get_directory_by_path("{braces}/{braces}_sub").files,
+                         {"{braces}.txt": File.get("{braces}.txt")})
+        self.assertEqual(lazy.to_dict(), fs.to_dict())
+
+    def test_serializes_untouched_directories_without_building_them(self):
+        fs = self._save(_tree("first"), _tree("second"))
+        lazy = LazyFileStructure.open(self.json_path)
+        lazy.get_directory_by_path("first/sub").add_file(File.get("b.py"))
+        expected = fs.to_dict()
+        expected["first"]["directories"]["sub"]["files"].append({"name": "b.py"})
+        self.assertEqual(lazy.to_dict(), expected)
+        self.assertEqual([name for name, _ in lazy.directories.loaded_items()], ["first"])
+
+    def test_file_rewritten_after_open(self):
+        self._save(*(_tree(f"top{i}") for i in range(50)))
+        lazy = LazyFileStructure.open(self.json_path)
+        FileStructure().to_json(self.json_path)  # truncates and rewrites in place
+        self.assertEqual(lazy.get_directory_by_path("top40/sub").name, "sub")
+
+    def test_empty_object(self):
+        self._write("{}")
+        lazy = LazyFileStructure.open(self.json_path)
+        self.assertEqual(lazy.to_dict(), {})
+        self.assertEqual(list(lazy), [])
+        self.assertIsNone(lazy.get_directory_by_path("missing"))
+
+    def test_empty_or_truncated_file_is_rejected(self):
+        for text in ("", '{"a": {"files": []', "[]"):
+            self._write(text)
+            with self.assertRaises(json.JSONDecodeError):
+                LazyFileStructure.open(self.json_path)
+
+    def test_top_level_names_that_need_normalizing(self):
+        self._save(_tree("/home/u/proj"), _tree("f:\\win"), _tree("rel/"))
+        tool = FileStructureTool(self.json_dir)
+        self.assertIsInstance(tool.file_structure, LazyFileStructure)
+        for path in ("/home/u/proj/sub", "f:\\win\\sub", "f:/win/sub", "rel/sub"):
+            self.assertIn(path, tool.file_structure)
+
+        tool.add_file("/home/u/proj/sub", File.get("new.py"))
+        with open(self.json_path, encoding="utf-8") as f:
+            saved = json.load(f)
+        self.assertIn({"name": "new.py"}, saved["/home/u/proj"]["directories"]["sub"]["files"])
+
+
+if __name__ == "__main__":
+    unittest.main()
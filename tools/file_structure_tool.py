@@ -1,11 +1,14 @@
 # file_structure_tool/tools/file_structure_tool.py
 
-import os, logger
-from typing import Optional
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional
 from file_structure_tool.models.file import File
 from file_structure_tool.models.directory import Directory
 from file_structure_tool.models.file_structure import FileStructure
+from file_structure_tool.models.lazy_file_structure import LazyFileStructure
 from file_structure_tool.services.json_crud import JsonCRUD
+from file_structure_tool.utils.logger import get_logger
 
 
 class FileStructureTool:
@@ -13,6 +16,8 @@ class FileStructureTool:
     A tool to manage the file structure with CRUD operations on JSON representations.
     """
 
+    logger = get_logger(__name__)
+
     def __init__(self, json_directory: str):
         """
         Initialize the FileStructureTool.
@@ -20,29 +25,77 @@ class FileStructureTool:
         :param json_directory: Directory where the JSON file representing the file structure is stored.
         """
         self.json_crud = JsonCRUD(directory=json_directory)
-        self.file_structure: Optional[FileStructure] = None
+        self.file_structure = None
         self.json_filename = "file_structure.json"
-
-        # Load existing file structure if it exists
-        if self.json_filename in self.json_crud.list_json_files():
-            self.file_structure = FileStructure.from_json(os.path.join(json_directory, self.json_filename))
-            print("Loaded existing file structure.")
+        # Unsaved-changes flag and nesting depth of open batch() blocks
+        self._dirty = False
+        self._batch_depth = 0
+
+        # Load existing file structure if it exists (one stat, not a directory listing)
+        json_path = os.path.join(json_directory, self.json_filename)
+        if os.path.isfile(json_path):
+            # Directories are parsed from the file as paths are resolved, not up front
+            self.file_structure = LazyFileStructure.open(json_path)
+            self.logger.info("Loaded existing file structure.")
         else:
             self.file_structure = FileStructure()
             self.save()
-            print("Initialized new file structure.")
+            self.logger.info("Initialized new file structure.")
+
+    @property
+    def file_structure(self) -> Optional[FileStructure]:
+        return self._file_structure
+
+    @file_structure.setter
+    def file_structure(self, file_structure: Optional[FileStructure]) -> None:
+        self._file_structure = file_structure
+        # get_directory(path) -> Optional[Directory], bound once per structure so
+        # callers (including require_directory_and_save) skip the attribute chain
+        self.get_directory = (
+            file_structure.get_directory_by_path if file_structure is not None else None
+        )
 
     def save(self) -> None:
         """
-        Save the current file structure to the JSON file.
+        Save the current file structure to the JSON file. Inside a batch() block the
+        write is deferred until the outermost block exits.
         """
+        if self._batch_depth:
+            self._dirty = True
+            return
         if self.file_structure:
             # Use the write_json method instead of create_json/update_json
             # (Since those do not exist in JsonCRUD)
             self.json_crud.write_json(self.json_filename, self.file_structure.to_dict())
-            print("File structure saved.")
+            self._dirty = False
+            self.logger.debug("File structure saved.")
         else:
-            print("No file structure to save.")
+            self.logger.warning("No file structure to save.")
+
+    @contextmanager
+    def batch(self) -> Iterator["FileStructureTool"]:
+        """
+        Group several mutations so the JSON file is rewritten once, when the
+        outermost batch exits, instead of after every operation:
+
+            with tool.batch():
+                tool.add_directory(...)
+                tool.add_file(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.save()
+
+    def _mark_dirty(self) -> None:
+        """
+        Record an unsaved change, saving immediately unless a batch is open.
+        """
+        self._dirty = True
+        self.save()
 
     def load(self) -> None:
         """
@@ -51,9 +104,28 @@ class FileStructureTool:
         data = self.json_crud.read_json(self.json_filename)
         if data:
             self.file_structure = FileStructure.from_dict(data)
-            print("File structure loaded successfully.")
+            self.logger.info("File structure loaded successfully.")
         else:
-            print("No existing file structure found.")
+            self.logger.info("No existing file structure found.")
+
+    def _resolve(self, path: str) -> Optional[Directory]:
+        """
+        Return the directory at the given path, or None if it does not exist.
+
+        Paths are resolved through the FileStructure's flat path index (a single
+        dict probe) rather than by walking the tree one component at a time. The
+        mutators below keep that index current as directories come and go.
+        """
+        current_dir = self.get_directory(path)
+        if current_dir is None:
+            prefix, _ = self.file_structure.longest_prefix(path)
+            if prefix:
+                self.logger.warning(
+                    "Path '%s' does not exist; deepest existing directory is '%s'.", path, prefix
+                )
+            else:
+                self.logger.warning("Path '%s' does not exist.", path)
+        return current_dir
 
     def add_directory(self, path: str, directory: Directory) -> None:
         """
@@ -62,22 +134,13 @@ class FileStructureTool:
         :param path: Path where the directory should be added (e.g., 'f:/langchain_project/langchain').
         :param directory: Directory instance to add.
         """
-        parts = path.strip("/").split("/")
-        current_dirs = self.file_structure.directories
-        current_dir = None
-        for part in parts:
-            if part in current_dirs:
-                current_dir = current_dirs[part]
-                current_dirs = current_dir.directories
-            else:
-                print(f"Path '{path}' does not exist.")
-                return
-        if current_dir:
-            current_dir.add_directory(directory)
-            self.save()
-            print(f"Added directory '{directory.name}' at path '{path}'.")
-        else:
-            print(f"Directory '{path}' not found.")
+        current_dir = self._resolve(path)
+        if current_dir is None:
+            return
+        current_dir.add_directory(directory)
+        self.file_structure.index_directory(f"{path}/{directory.name}", directory)
+        self._mark_dirty()
+        self.logger.debug("Added directory '%s' at path '%s'.", directory.name, path)
 
     def add_file(self, path: str, file: File) -> None:
         """
@@ -86,22 +149,12 @@ class FileStructureTool:
         :param path: Path where the file should be added (e.g., 'f:/langchain_project/langchain').
         :param file: File instance to add.
         """
-        parts = path.strip("/").split("/")
-        current_dirs = self.file_structure.directories
-        current_dir = None
-        for part in parts:
-            if part in current_dirs:
-                current_dir = current_dirs[part]
-                current_dirs = current_dir.directories
-            else:
-                print(f"Path '{path}' does not exist.")
-                return
-        if current_dir:
-            current_dir.add_file(file)
-            self.save()
-            print(f"Added file '{file.name}' at path '{path}'.")
-        else:
-            print(f"Directory '{path}' not found.")
+        current_dir = self._resolve(path)
+        if current_dir is None:
+            return
+        current_dir.add_file(file)
+        self._mark_dirty()
+        self.logger.debug("Added file '%s' at path '%s'.", file.name, path)
 
     def delete_file(self, path: str, filename: str) -> None:
         """
@@ -110,26 +163,15 @@ class FileStructureTool:
         :param path: Path where the file is located (e.g., 'f:/langchain_project/langchain').
         :param filename: Name of the file to delete.
         """
-        parts = path.strip("/").split("/")
-        current_dirs = self.file_structure.directories
-        current_dir = None
-        for part in parts:
-            if part in current_dirs:
-                current_dir = current_dirs[part]
-                current_dirs = current_dir.directories
-            else:
-                print(f"Path '{path}' does not exist.")
-                return
-        if current_dir:
-            file_to_remove = next((f for f in current_dir.files if f.name == filename), None)
-            if file_to_remove:
-                current_dir.files.remove(file_to_remove)
-                self.save()
-                print(f"Deleted file '{filename}' from path '{path}'.")
-            else:
-                print(f"File '{filename}' not found in path '{path}'.")
+        current_dir = self._resolve(path)
+        if current_dir is None:
+            return
+        if filename in current_dir.files:
+            current_dir.remove_file(filename)
+            self._mark_dirty()
+            self.logger.debug("Deleted file '%s' from path '%s'.", filename, path)
         else:
-            print(f"Directory '{path}' not found.")
+            self.logger.warning("File '%s' not found in path '%s'.", filename, path)
 
     def delete_directory(self, path: str, directory_name: str) -> None:
         """
@@ -138,28 +180,19 @@ class FileStructureTool:
         :param path: Path where the directory is located (e.g., 'f:/langchain_project').
         :param directory_name: Name of the directory to delete.
         """
-        parts = path.strip("/").split("/")
-        current_dirs = self.file_structure.directories
-        current_dir = None
-        for part in parts:
-            if part in current_dirs:
-                current_dir = current_dirs[part]
-                current_dirs = current_dir.directories
-            else:
-                print(f"Path '{path}' does not exist.")
-                return
-        if current_dir:
-            if directory_name in current_dir.directories:
-                del current_dir.directories[directory_name]
-                self.save()
-                print(f"Deleted directory '{directory_name}' from path '{path}'.")
-            else:
-                print(f"Directory '{directory_name}' not found in path '{path}'.")
+        current_dir = self._resolve(path)
+        if current_dir is None:
+            return
+        if directory_name in current_dir.directories:
+            current_dir.remove_directory(directory_name)
+            self.file_structure.unindex_path(f"{path}/{directory_name}")
+            self._mark_dirty()
+            self.logger.debug("Deleted directory '%s' from path '%s'.", directory_name, path)
         else:
-            print(f"Directory '{path}' not found.")
+            self.logger.warning("Directory '%s' not found in path '%s'.", directory_name, path)
 
     def display_structure(self):
         """
         Display the current file structure.
         """
-        print(self.file_structure)
+        print(self.file_structure.to_pretty_json())
@@ -13,12 +13,22 @@ def require_directory_and_save(func: Callable) -> Callable:
     """
     Ensures a directory path is valid before proceeding, then auto-saves changes.
     Typically used in DirectoryManagerTool methods for adding/removing files/directories.
+
+    The host provides file_structure and save(), and may provide a pre-bound
+    get_directory(path) lookup (FileStructureTool does, and its save() is deferred
+    while a batch() block is open); without one, file_structure.get_directory_by_path
+    is used. The wrapped method may mutate target_dir freely: the path index is
+    checked against the live tree, so directories added or removed there are
+    found (or not) on the next call.
     """
     @wraps(func)
     def wrapper(self, path: str, *args, **kwargs) -> Any:
-        target_dir = self.file_structure.get_directory_by_path(path)
-        if not target_dir:
-            self.logger.error(f"Directory not found for path: '{path}'.")
+        get_directory = (
+            getattr(self, "get_directory", None) or self.file_structure.get_directory_by_path
+        )
+        target_dir = get_directory(path)
+        if target_dir is None:
+            self.logger.error("Directory not found for path: '%s'.", path)
             raise ValueError(f"Directory not found for path: '{path}'.")
         result = func(self, target_dir, *args, **kwargs)
         self.save()
@@ -0,0 +1,40 @@
+# file_structure_tool/utils/json_codec.py
+"""
+JSON Codec Module
+-----------------
+Encodes and decodes JSON documents with orjson when it is installed, falling
+back to the standard library json module otherwise. Both paths produce
+UTF-8 bytes with a two-space indent, so files look the same either way.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+catching the standard library exception.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Buffer size for files written as one pre-encoded blob (JSON documents, reports)
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize a Python object to indented JSON, returned as UTF-8 bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document given as bytes or str.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
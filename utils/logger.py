@@ -2,19 +2,32 @@
 import logging
 import os
 import sys
+from functools import lru_cache
+from typing import Set
 
+# Read an environment variable once at import, default to DEBUG if not set
+_LEVEL = getattr(
+    logging, os.environ.get("FILE_STRUCTURE_LOG_LEVEL", "DEBUG").upper(), logging.DEBUG
+)
+
+# One handler shared by every logger get_logger sets up
+_HANDLER = logging.StreamHandler(sys.stdout)
+_HANDLER.setFormatter(logging.Formatter(
+    "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
+))
+
+# Names of loggers get_logger has already set up
+_configured: Set[str] = set()
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
-    
-    # Read an environment variable, default to DEBUG if not set
-    log_level_str = os.environ.get("FILE_STRUCTURE_LOG_LEVEL", "DEBUG").upper()
-    log_level = getattr(logging, log_level_str, logging.DEBUG)
+    if name in _configured:
+        return logger
 
-    logger.setLevel(log_level)
+    logger.setLevel(_LEVEL)
+    # Respect handlers the application attached before we got here
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(logging.Formatter(
-            "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
-        ))
-        logger.addHandler(handler)
+        logger.addHandler(_HANDLER)
+    _configured.add(name)
     return logger